@@ -11,7 +11,6 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from tradesage.utils import load_data
 from tradesage.strategy import SMACrossover
 from tradesage.backtester import Backtester
-import matplotlib.pyplot as plt
 
 def main():
     """Example of using TradeSage programmatically"""
@@ -45,6 +44,7 @@ def main():
     
     # 5. Create custom plot
     print("\n📈 Creating custom visualization...")
+    import matplotlib.pyplot as plt
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
     
     # Price and moving averages
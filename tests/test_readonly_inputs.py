@@ -0,0 +1,75 @@
+"""
+Regression tests for read-only array inputs to the numba kernels.
+
+pandas copy-on-write hands out read-only zero-copy views from
+Series.to_numpy(), and np.ascontiguousarray passes an already-contiguous
+read-only array through unchanged. The kernels must therefore accept
+read-only arrays on the JIT path, which is what every fresh clone runs
+(the AOT extension is built separately and gitignored).
+"""
+import numpy as np
+import pandas as pd
+
+from tradesage import _kernels
+from tradesage.backtester import Backtester
+from tradesage.metrics import calculate_all_metrics, max_drawdown, win_rate
+from tradesage.strategy import SMACrossover
+
+def _float64_close_frame(n: int = 300) -> pd.DataFrame:
+    # user-supplied frame, e.g. straight from yfinance: float64 Close
+    rng = np.random.default_rng(0)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n))
+    index = pd.date_range('2020-01-02', periods=n, freq='B')
+    return pd.DataFrame({'Close': close}, index=index)
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr = np.ascontiguousarray(arr)
+    arr.setflags(write=False)
+    return arr
+
+def _force_jit_kernels(monkeypatch):
+    # pin the njit kernels, as on a machine without the AOT .so
+    import tradesage.backtester as backtester
+    import tradesage.metrics as metrics
+    import tradesage.strategy as strategy
+    monkeypatch.setattr(strategy, 'sma_pair', _kernels._jit_sma_pair)
+    monkeypatch.setattr(backtester, 'equity_curve', _kernels._jit_equity_curve)
+    monkeypatch.setattr(metrics, '_trade_walk', _kernels._jit_trade_walk)
+    monkeypatch.setattr(metrics, '_max_dd', _kernels._jit_max_dd)
+
+def test_jit_kernels_accept_readonly_arrays():
+    close = _readonly(np.linspace(100.0, 110.0, 50))
+    short_ma, long_ma = _kernels._jit_sma_pair(close, 5, 20)
+    assert short_ma.shape == long_ma.shape == close.shape
+
+    returns = _readonly(np.full(50, 0.001))
+    equity = _kernels._jit_equity_curve(returns, 100000.0)
+    assert equity.shape == returns.shape
+
+    positions = _readonly(np.array([0, 1, 0, -1, 1, -1], dtype=np.int8))
+    price = _readonly(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+    trades = _kernels._jit_trade_walk(positions, price)
+    assert trades.shape == (2,)
+
+    assert _kernels._jit_max_dd(_readonly(np.array([2.0, 1.0, 3.0]))) == -0.5
+
+def test_backtester_runs_on_float64_close_frame(monkeypatch):
+    _force_jit_kernels(monkeypatch)
+    data = _float64_close_frame()
+    bt = Backtester(data, SMACrossover(short_window=5, long_window=20))
+    stats = bt.run()
+    assert np.isfinite(stats['Cumulative Return'])
+    assert stats['Total Trades'] > 0
+
+def test_metrics_accept_generated_signals(monkeypatch):
+    _force_jit_kernels(monkeypatch)
+    data = _float64_close_frame()
+    strat = SMACrossover(short_window=5, long_window=20)
+    signals = strat.generate_signals(data)
+    assert 0.0 <= win_rate(signals) <= 1.0
+
+    bt = Backtester(data, strat)
+    stats = bt.run()
+    assert max_drawdown(bt.equity) <= 0.0
+    wrapped = calculate_all_metrics(bt.returns, bt.equity, bt.signals)
+    assert wrapped['Total Trades'] == stats['Total Trades']
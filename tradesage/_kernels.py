@@ -0,0 +1,137 @@
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def sma_pair(close, w_short, w_long):
+    """
+    Compute short and long simple moving averages in one streaming pass.
+
+    Maintains a running sum per window (one add, one subtract per step) and
+    divides by min(i + 1, window) to match pandas rolling(min_periods=1).
+
+    Keep this incremental: a sliding_window_view port would cost O(N*W)
+    memory and compute versus O(N) here, and loses as the window grows.
+
+    Args:
+        close: float64 array of closing prices
+        w_short: short window length
+        w_long: long window length
+
+    Returns:
+        Tuple of (short_ma, long_ma) float64 arrays
+    """
+    n = close.shape[0]
+    short_ma = np.empty(n, dtype=np.float64)
+    long_ma = np.empty(n, dtype=np.float64)
+    s_short = 0.0
+    s_long = 0.0
+    for i in range(n):
+        s_short += close[i]
+        s_long += close[i]
+        if i >= w_short:
+            s_short -= close[i - w_short]
+        if i >= w_long:
+            s_long -= close[i - w_long]
+        short_ma[i] = s_short / min(i + 1, w_short)
+        long_ma[i] = s_long / min(i + 1, w_long)
+    return short_ma, long_ma
+
+@njit(cache=True)
+def equity_curve(returns, capital):
+    """
+    Build the portfolio equity curve in one pass.
+
+    Equivalent to (1 + returns).cumprod() * capital without the add,
+    cumprod and scale temporaries.
+
+    Args:
+        returns: float64 array of per-period strategy returns
+        capital: starting portfolio value
+
+    Returns:
+        float64 array of portfolio values
+    """
+    n = returns.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    acc = 1.0
+    for i in range(n):
+        acc *= 1.0 + returns[i]
+        out[i] = acc * capital
+    return out
+
+@njit(cache=True)
+def trade_walk(positions, price):
+    """
+    Entry/exit state machine over the positions array.
+
+    A trade opens at a +1 while flat and closes at the next -1; the loop
+    carries the in_position flag, so it is inherently sequential and a
+    natural JIT target.
+
+    Args:
+        positions: int8 array of entry (+1) / exit (-1) markers
+        price: float64 array of prices
+
+    Returns:
+        float64 array with one return per completed trade
+    """
+    n = positions.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    k = 0
+    in_position = False
+    entry_price = 0.0
+    for i in range(n):
+        p = positions[i]
+        if p == 1 and not in_position:
+            entry_price = price[i]
+            in_position = True
+        elif p == -1 and in_position:
+            out[k] = (price[i] - entry_price) / entry_price
+            k += 1
+            in_position = False
+    return out[:k].copy()
+
+@njit(cache=True, fastmath=True)
+def max_dd(equity):
+    """
+    Maximum drawdown of an equity curve in a single streaming pass.
+
+    Tracks the running peak and the worst (value - peak) / peak seen so
+    far, avoiding the cummax and drawdown temporaries.
+
+    Args:
+        equity: float64 array of portfolio values
+
+    Returns:
+        Maximum drawdown as a negative fraction (0.0 if empty)
+    """
+    n = equity.shape[0]
+    if n == 0:
+        return 0.0
+    peak = equity[0]
+    mdd = 0.0
+    for i in range(n):
+        v = equity[i]
+        if v > peak:
+            peak = v
+        dd = (v - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    return mdd
+
+# Dispatch stays lazy: pandas copy-on-write hands out read-only views, and
+# eager signatures would reject them; lazy njit compiles a specialization
+# per layout instead (call sites guarantee contiguity).
+# The njit implementations stay reachable for the AOT build script even
+# when the compiled extension overrides the public names below.
+_jit_sma_pair = sma_pair
+_jit_equity_curve = equity_curve
+_jit_trade_walk = trade_walk
+_jit_max_dd = max_dd
+
+# Prefer the AOT-compiled kernels when they have been built with
+# `python -m tradesage._kernels_aot`; they skip JIT dispatch entirely.
+try:
+    from .tradesage_kernels import sma_pair, equity_curve, trade_walk, max_dd  # noqa: F811
+except ImportError:
+    pass
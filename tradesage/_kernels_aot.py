@@ -0,0 +1,21 @@
+"""
+Ahead-of-time build for the numba kernels.
+
+Running ``python -m tradesage._kernels_aot`` compiles the kernels into a
+``tradesage_kernels`` extension module next to this file. When present, it
+is picked up by ``_kernels`` at import time, removing the first-call JIT
+compile latency that otherwise dominates short CLI runs.
+"""
+from numba.pycc import CC
+
+from . import _kernels
+
+cc = CC('tradesage_kernels')
+
+cc.export('sma_pair', 'UniTuple(f8[::1], 2)(f8[::1], i8, i8)')(_kernels._jit_sma_pair.py_func)
+cc.export('equity_curve', 'f8[::1](f8[::1], f8)')(_kernels._jit_equity_curve.py_func)
+cc.export('trade_walk', 'f8[::1](i1[::1], f8[::1])')(_kernels._jit_trade_walk.py_func)
+cc.export('max_dd', 'f8(f8[::1])')(_kernels._jit_max_dd.py_func)
+
+if __name__ == '__main__':
+    cc.compile()
@@ -1,25 +1,36 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from .metrics import compute_returns, calculate_all_metrics
+from ._kernels import equity_curve
+from .metrics import _strategy_returns, calculate_all_metrics_np
 from .utils import save_plot
 import os
 
 class Backtester:
     def __init__(self, data: pd.DataFrame, strategy, initial_capital: float = 100000.0):
-        self.data = data.copy()
+        # shared read-only view; callers must not mutate data in place
+        self.data = data
         self.strategy = strategy
         self.initial_capital = initial_capital
 
     def run(self):
-        # generate signals
-        signals = self.strategy.generate_signals(self.data)
-        # calculate returns and equity curve
-        strat_ret = compute_returns(signals)
-        # Fill NaN values with 0 for the first period
-        strat_ret = strat_ret.fillna(0)
-        equity = (1 + strat_ret).cumprod() * self.initial_capital
-        # compute comprehensive metrics
-        stats = calculate_all_metrics(strat_ret, equity, signals)
+        # hot path: everything stays in numpy arrays
+        arrays = self.strategy.generate_signal_arrays(self.data)
+        ret = _strategy_returns(arrays.price, arrays.signal)
+        equity_values = equity_curve(ret, self.initial_capital)
+        # compute comprehensive metrics on the raw arrays
+        stats = calculate_all_metrics_np(ret, equity_values,
+                                         arrays.positions, arrays.price)
+        # boundary: wrap the buffers back into pandas once, for plotting
+        # and callers inspecting .signals/.returns/.equity
+        index = self.data.index
+        signals = pd.DataFrame({
+            'price': arrays.price,
+            'short_ma': arrays.short_ma,
+            'long_ma': arrays.long_ma,
+            'signal': arrays.signal,
+            'positions': arrays.positions,
+        }, index=index)
+        strat_ret = pd.Series(ret, index=index)
+        equity = pd.Series(equity_values, index=index)
         self.signals = signals
         self.returns = strat_ret
         self.equity = equity
@@ -27,6 +38,11 @@ class Backtester:
         return stats
 
     def plot_equity(self, output_path: str):
+        # lazy import: matplotlib startup dominates short runs, and the
+        # Agg backend skips GUI backend initialization entirely
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots()
         ax.plot(self.equity.index, self.equity.values)
         ax.set_title('Equity Curve')
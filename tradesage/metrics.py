@@ -1,47 +1,65 @@
 import numpy as np
 import pandas as pd
 
+from ._kernels import max_dd as _max_dd, trade_walk as _trade_walk
+
+def _strategy_returns(price: np.ndarray, signal: np.ndarray) -> np.ndarray:
+    """
+    Array core of compute_returns: price changes scaled by the lagged signal.
+    """
+    price = price.astype(np.float64, copy=False)
+    returns = np.empty_like(price)
+    if returns.size:
+        returns[0] = 0.0
+        # today's signal applies to tomorrow's return
+        np.divide(price[1:] - price[:-1], price[:-1], out=returns[1:])
+        returns[1:] *= signal[:-1]
+    return returns
+
 def compute_returns(signals: pd.DataFrame) -> pd.Series:
     """
     Compute strategy returns based on positions and price changes.
     """
-    returns = signals['price'].pct_change().fillna(0)
-    # shift signal so that today's signal applies to tomorrow's return
-    strategy_returns = returns * signals['signal'].shift(1)
-    return strategy_returns
+    returns = _strategy_returns(signals['price'].to_numpy(),
+                                signals['signal'].to_numpy())
+    return pd.Series(returns, index=signals.index)
 
-def sharpe_ratio(returns: pd.Series, periods_per_year: int = 252, risk_free_rate: float = 0.0) -> float:
+def sharpe_ratio(returns: np.ndarray, periods_per_year: int = 252, risk_free_rate: float = 0.0) -> float:
     """
     Annualized Sharpe ratio.
-    
+
     Args:
-        returns: Series of returns
+        returns: Array (or Series) of returns
         periods_per_year: Number of periods per year (252 for daily)
         risk_free_rate: Risk-free rate (default 0.0)
-    
+
     Returns:
         Annualized Sharpe ratio
     """
-    excess_returns = returns - risk_free_rate
+    returns = np.asarray(returns, dtype=np.float64)
+    # rf=0 is the common path; skip the full-array subtraction there
+    excess_returns = returns if risk_free_rate == 0.0 else returns - risk_free_rate
     mean = excess_returns.mean() * periods_per_year
-    std = excess_returns.std() * np.sqrt(periods_per_year)
+    std = excess_returns.std(ddof=1) * np.sqrt(periods_per_year)
     return mean / std if std != 0 else np.nan
 
-def sortino_ratio(returns: pd.Series, periods_per_year: int = 252, risk_free_rate: float = 0.0) -> float:
+def sortino_ratio(returns: np.ndarray, periods_per_year: int = 252, risk_free_rate: float = 0.0) -> float:
     """
     Annualized Sortino ratio (downside risk-adjusted return).
-    
+
     Args:
-        returns: Series of returns
+        returns: Array (or Series) of returns
         periods_per_year: Number of periods per year (252 for daily)
         risk_free_rate: Risk-free rate (default 0.0)
-    
+
     Returns:
         Annualized Sortino ratio
     """
-    excess_returns = returns - risk_free_rate
+    returns = np.asarray(returns, dtype=np.float64)
+    excess_returns = returns if risk_free_rate == 0.0 else returns - risk_free_rate
     downside_returns = excess_returns[excess_returns < 0]
-    downside_std = downside_returns.std() * np.sqrt(periods_per_year)
+    downside_std = (downside_returns.std(ddof=1) if downside_returns.size > 1
+                    else np.nan) * np.sqrt(periods_per_year)
     mean = excess_returns.mean() * periods_per_year
     return mean / downside_std if downside_std != 0 else np.nan
 
@@ -55,9 +73,7 @@ def max_drawdown(equity: pd.Series) -> float:
     Returns:
         Maximum drawdown as a negative percentage
     """
-    cum_max = equity.cummax()
-    drawdown = (equity - cum_max) / cum_max
-    return drawdown.min()
+    return float(_max_dd(np.ascontiguousarray(equity.to_numpy(), dtype=np.float64)))
 
 def calmar_ratio(returns: pd.Series, equity: pd.Series, periods_per_year: int = 252) -> float:
     """
@@ -75,42 +91,48 @@ def calmar_ratio(returns: pd.Series, equity: pd.Series, periods_per_year: int =
     max_dd = abs(max_drawdown(equity))
     return annualized_return / max_dd if max_dd != 0 else np.nan
 
+def _compute_trade_returns(signals: pd.DataFrame) -> np.ndarray:
+    """
+    Compute the return of each completed long trade with the compiled walk.
+
+    A trade opens at a +1 in 'positions' and closes at the next -1;
+    re-entries before that exit are ignored. The result is cached on
+    ``signals.attrs`` so repeated metric calls on the same frame do not
+    rescan it.
+
+    Args:
+        signals: DataFrame with 'positions' and 'price' columns
+
+    Returns:
+        Array of per-trade returns (empty if no completed trades)
+    """
+    cached = signals.attrs.get('_trade_returns')
+    if cached is not None:
+        return cached
+
+    pos = np.ascontiguousarray(signals['positions'].to_numpy(), dtype=np.int8)
+    price = np.ascontiguousarray(signals['price'].to_numpy(), dtype=np.float64)
+    trade_returns = _trade_walk(pos, price)
+
+    signals.attrs['_trade_returns'] = trade_returns
+    return trade_returns
+
 def win_rate(signals: pd.DataFrame) -> float:
     """
     Calculate win rate of trades.
-    
+
     Args:
         signals: DataFrame with 'positions' column indicating trade entries/exits
-    
+
     Returns:
         Win rate as a percentage
     """
-    positions = signals['positions']
-    trades = positions[positions != 0]
-    
-    if len(trades) == 0:
-        return 0.0
-    
-    # Calculate returns for each trade
-    trade_returns = []
-    in_position = False
-    entry_price = 0
-    
-    for i, (date, row) in enumerate(signals.iterrows()):
-        if row['positions'] == 1 and not in_position:  # Enter long position
-            entry_price = row['price']
-            in_position = True
-        elif row['positions'] == -1 and in_position:  # Exit long position
-            exit_price = row['price']
-            trade_return = (exit_price - entry_price) / entry_price
-            trade_returns.append(trade_return)
-            in_position = False
-    
-    if len(trade_returns) == 0:
+    trade_returns = _compute_trade_returns(signals)
+
+    if trade_returns.size == 0:
         return 0.0
-    
-    winning_trades = sum(1 for ret in trade_returns if ret > 0)
-    return winning_trades / len(trade_returns)
+
+    return (trade_returns > 0).mean()
 
 def average_trade_return(signals: pd.DataFrame) -> float:
     """
@@ -122,28 +144,9 @@ def average_trade_return(signals: pd.DataFrame) -> float:
     Returns:
         Average trade return
     """
-    positions = signals['positions']
-    trades = positions[positions != 0]
-    
-    if len(trades) == 0:
-        return 0.0
-    
-    # Calculate returns for each trade
-    trade_returns = []
-    in_position = False
-    entry_price = 0
-    
-    for i, (date, row) in enumerate(signals.iterrows()):
-        if row['positions'] == 1 and not in_position:  # Enter long position
-            entry_price = row['price']
-            in_position = True
-        elif row['positions'] == -1 and in_position:  # Exit long position
-            exit_price = row['price']
-            trade_return = (exit_price - entry_price) / entry_price
-            trade_returns.append(trade_return)
-            in_position = False
-    
-    return np.mean(trade_returns) if trade_returns else 0.0
+    trade_returns = _compute_trade_returns(signals)
+
+    return trade_returns.mean() if trade_returns.size else 0.0
 
 def profit_factor(signals: pd.DataFrame) -> float:
     """
@@ -155,66 +158,101 @@ def profit_factor(signals: pd.DataFrame) -> float:
     Returns:
         Profit factor
     """
-    positions = signals['positions']
-    trades = positions[positions != 0]
-    
-    if len(trades) == 0:
-        return 0.0
-    
-    # Calculate returns for each trade
-    trade_returns = []
-    in_position = False
-    entry_price = 0
-    
-    for i, (date, row) in enumerate(signals.iterrows()):
-        if row['positions'] == 1 and not in_position:  # Enter long position
-            entry_price = row['price']
-            in_position = True
-        elif row['positions'] == -1 and in_position:  # Exit long position
-            exit_price = row['price']
-            trade_return = (exit_price - entry_price) / entry_price
-            trade_returns.append(trade_return)
-            in_position = False
-    
-    if not trade_returns:
+    trade_returns = _compute_trade_returns(signals)
+
+    if trade_returns.size == 0:
         return 0.0
-    
-    gross_profit = sum(ret for ret in trade_returns if ret > 0)
-    gross_loss = abs(sum(ret for ret in trade_returns if ret < 0))
-    
+
+    gross_profit = trade_returns[trade_returns > 0].sum()
+    gross_loss = -trade_returns[trade_returns < 0].sum()
+
     return gross_profit / gross_loss if gross_loss != 0 else np.inf
 
-def calculate_all_metrics(returns: pd.Series, equity: pd.Series, signals: pd.DataFrame) -> dict:
+def calculate_all_metrics_np(returns: np.ndarray, equity: np.ndarray,
+                             positions: np.ndarray, price: np.ndarray) -> dict:
     """
-    Calculate comprehensive performance metrics.
-    
+    Array core of calculate_all_metrics; all inputs are plain ndarrays.
+
     Args:
-        returns: Series of strategy returns
-        equity: Series of portfolio values
-        signals: DataFrame with strategy signals
-    
+        returns: Array of strategy returns
+        equity: Array of portfolio values
+        positions: Array of entry (+1) / exit (-1) markers
+        price: Array of prices
+
     Returns:
         Dictionary containing all performance metrics
     """
     # Calculate cumulative return properly
-    initial_value = equity.iloc[0] if len(equity) > 0 else 1.0
-    final_value = equity.iloc[-1] if len(equity) > 0 else 1.0
+    initial_value = equity[0] if equity.size else 1.0
+    final_value = equity[-1] if equity.size else 1.0
     cumulative_return = (final_value / initial_value - 1) if initial_value != 0 else 0.0
-    
+
+    # Compute trade returns once and derive all trade statistics from them
+    positions = np.ascontiguousarray(positions, dtype=np.int8)
+    price = np.ascontiguousarray(price, dtype=np.float64)
+    trade_returns = _trade_walk(positions, price)
+    gross_profit = trade_returns[trade_returns > 0].sum()
+    gross_loss = -trade_returns[trade_returns < 0].sum()
+
+    # Fused reductions: one pass over the returns array feeds every ratio
+    # below instead of separate .mean()/.std() calls.
+    ret_arr = np.ascontiguousarray(returns, dtype=np.float64)
+    pos_mask = ret_arr > 0
+    neg_mask = ret_arr < 0
+
+    n = ret_arr.size
+    total = ret_arr.sum()
+    total_sq = (ret_arr * ret_arr).sum()
+    mean = total / n if n else np.nan
+    # sample variance (ddof=1), matching pandas .std()
+    var = (total_sq - n * mean * mean) / (n - 1) if n > 1 else np.nan
+    std = np.sqrt(var)
+
+    downside = ret_arr[neg_mask]
+    downside_std = downside.std(ddof=1) if downside.size > 1 else np.nan
+
+    ann_return = mean * 252
+    ann_vol = std * np.sqrt(252)
+    ann_downside_vol = downside_std * np.sqrt(252)
+    max_dd = float(_max_dd(np.ascontiguousarray(equity, dtype=np.float64)))
+
     metrics = {
         'Cumulative Return': cumulative_return,
-        'Sharpe Ratio': sharpe_ratio(returns),
-        'Sortino Ratio': sortino_ratio(returns),
-        'Max Drawdown': max_drawdown(equity),
-        'Calmar Ratio': calmar_ratio(returns, equity),
-        'Total Trades': int(signals['positions'].abs().sum()),
-        'Win Rate': win_rate(signals),
-        'Average Trade Return': average_trade_return(signals),
-        'Profit Factor': profit_factor(signals),
-        'Annualized Return': returns.mean() * 252,
-        'Annualized Volatility': returns.std() * np.sqrt(252),
-        'Best Trade': max([ret for ret in returns if ret > 0]) if any(returns > 0) else 0.0,
-        'Worst Trade': min([ret for ret in returns if ret < 0]) if any(returns < 0) else 0.0
+        'Sharpe Ratio': ann_return / ann_vol if ann_vol != 0 else np.nan,
+        'Sortino Ratio': ann_return / ann_downside_vol if ann_downside_vol != 0 else np.nan,
+        'Max Drawdown': max_dd,
+        'Calmar Ratio': ann_return / abs(max_dd) if max_dd != 0 else np.nan,
+        'Total Trades': int(np.count_nonzero(positions)),
+        'Win Rate': (trade_returns > 0).mean() if trade_returns.size else 0.0,
+        'Average Trade Return': trade_returns.mean() if trade_returns.size else 0.0,
+        'Profit Factor': (gross_profit / gross_loss if gross_loss != 0 else np.inf)
+                         if trade_returns.size else 0.0,
+        'Annualized Return': ann_return,
+        'Annualized Volatility': ann_vol,
+        'Best Trade': ret_arr[pos_mask].max() if pos_mask.any() else 0.0,
+        'Worst Trade': ret_arr[neg_mask].min() if neg_mask.any() else 0.0
     }
-    
+
     return metrics
+
+def calculate_all_metrics(returns: pd.Series, equity: pd.Series, signals: pd.DataFrame) -> dict:
+    """
+    Calculate comprehensive performance metrics.
+
+    Thin wrapper around calculate_all_metrics_np: extracts the numpy
+    buffers once and hands them to the array core.
+
+    Args:
+        returns: Series of strategy returns
+        equity: Series of portfolio values
+        signals: DataFrame with strategy signals
+
+    Returns:
+        Dictionary containing all performance metrics
+    """
+    return calculate_all_metrics_np(
+        returns.to_numpy(),
+        equity.to_numpy(),
+        signals['positions'].to_numpy(),
+        signals['price'].to_numpy(),
+    )
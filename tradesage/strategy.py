@@ -1,5 +1,19 @@
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
+from ._kernels import sma_pair
+
+@dataclass
+class SignalArrays:
+    """Raw signal arrays for one strategy run; no index attached."""
+    price: np.ndarray
+    short_ma: np.ndarray
+    long_ma: np.ndarray
+    signal: np.ndarray
+    positions: np.ndarray
+
 class SMACrossover:
     def __init__(self, short_window: int = 50, long_window: int = 200):
         if short_window >= long_window:
@@ -7,17 +21,39 @@ class SMACrossover:
         self.short = short_window
         self.long = long_window
 
+    def generate_signal_arrays(self, data: pd.DataFrame) -> SignalArrays:
+        """
+        Compute signals as plain numpy arrays (the hot path):
+          - 'signal': +1 for long, 0 for flat
+          - 'positions': diff of signal (entry/exit)
+        """
+        # contiguous float64 so the kernel specializes on SIMD-friendly loads
+        close = np.ascontiguousarray(data['Close'].to_numpy(), dtype=np.float64)
+        short_ma, long_ma = sma_pair(close, self.short, self.long)
+        signal = (short_ma > long_ma).astype(np.int8)
+        positions = np.empty_like(signal)
+        if signal.size:
+            positions[0] = 0
+            np.subtract(signal[1:], signal[:-1], out=positions[1:])
+        return SignalArrays(
+            price=data['Close'].to_numpy(),
+            short_ma=short_ma,
+            long_ma=long_ma,
+            signal=signal,
+            positions=positions,
+        )
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Returns DataFrame with columns:
           - 'signal': +1 for long, 0 for flat
           - 'positions': diff of signal (entry/exit)
         """
-        signals = pd.DataFrame(index=data.index)
-        signals['price'] = data['Close']
-        signals['short_ma'] = data['Close'].rolling(window=self.short, min_periods=1).mean()
-        signals['long_ma']  = data['Close'].rolling(window=self.long, min_periods=1).mean()
-        signals['signal']   = 0
-        signals.loc[signals['short_ma'] > signals['long_ma'], 'signal'] = 1
-        signals['positions'] = signals['signal'].diff().fillna(0)
-        return signals
+        arrays = self.generate_signal_arrays(data)
+        return pd.DataFrame({
+            'price': arrays.price,
+            'short_ma': arrays.short_ma,
+            'long_ma': arrays.long_ma,
+            'signal': arrays.signal,
+            'positions': arrays.positions,
+        }, index=data.index)
@@ -0,0 +1,44 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from .strategy import SMACrossover
+from .backtester import Backtester
+
+def _run_one(close: np.ndarray, index: pd.Index, short_window: int,
+             long_window: int, initial_capital: float) -> dict:
+    data = pd.DataFrame({'Close': close}, index=index)
+    strat = SMACrossover(short_window=short_window, long_window=long_window)
+    stats = Backtester(data, strat, initial_capital=initial_capital).run()
+    return {'short_window': short_window, 'long_window': long_window, **stats}
+
+def sweep(data: pd.DataFrame, shorts, longs, initial_capital: float = 100000.0,
+          n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Run backtests for every valid (short_window, long_window) pair in parallel.
+
+    Each backtest is self-contained, so the sweep is parallelized across
+    processes with joblib. The Close column is handed to the workers as a
+    plain ndarray so joblib can memory-map it (mmap_mode='r') instead of
+    pickling a copy into every task; each worker rebuilds its small frame
+    around the shared buffer. Pairs with short >= long are skipped.
+
+    Args:
+        data: DataFrame with a 'Close' column
+        shorts: Iterable of short window lengths
+        longs: Iterable of long window lengths
+        initial_capital: Starting portfolio value per backtest
+        n_jobs: Number of worker processes (-1 for all cores)
+
+    Returns:
+        DataFrame with one row per parameter pair and a column per metric
+    """
+    close = np.ascontiguousarray(data['Close'].to_numpy())
+    index = data.index
+    pairs = [(s, l) for s, l in product(shorts, longs) if s < l]
+    results = Parallel(n_jobs=n_jobs, backend='loky', mmap_mode='r')(
+        delayed(_run_one)(close, index, s, l, initial_capital) for s, l in pairs
+    )
+    return pd.DataFrame(results)